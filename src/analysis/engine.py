@@ -22,33 +22,53 @@ from src.models import RefreshProgress
 
 logger = logging.getLogger(__name__)
 
-VALID_CONFIDENCE_LEVELS = {"low", "medium", "high"}
+VALID_CONFIDENCE_LEVELS = frozenset({"low", "medium", "high"})
 
 
 def _validate_signal_result(result: dict) -> dict:
-    """Clamp score to [-10, +10] and validate confidence level."""
-    validated = dict(result)
+    """Clamp score to [-10, +10] and validate confidence level.
 
-    raw_score = validated.get("score", 0)
+    Returns *result* itself when it is already valid; otherwise a copy
+    with the corrected fields (the input is never mutated).
+    """
+    raw_score = result.get("score", 0)
     clamped_score = max(-10, min(10, raw_score))
-    if clamped_score != raw_score:
+    raw_confidence = result.get("confidence", "low")
+    confidence_valid = raw_confidence in VALID_CONFIDENCE_LEVELS
+
+    # Compare by value: min/max may return an equal object of another type
+    # (e.g. int 10 for 10.0), which is not a clamp
+    in_range = clamped_score == raw_score
+
+    if "score" in result and "confidence" in result \
+            and in_range and confidence_valid:
+        return result
+
+    if not in_range:
         logger.warning(
             "Score %s out of range [-10, +10], clamped to %s",
             raw_score, clamped_score,
         )
-    validated["score"] = clamped_score
-
-    raw_confidence = validated.get("confidence", "low")
-    if raw_confidence not in VALID_CONFIDENCE_LEVELS:
+    if not confidence_valid:
         logger.warning(
             "Invalid confidence '%s', defaulting to 'low'", raw_confidence,
         )
-        raw_confidence = "low"
-    validated["confidence"] = raw_confidence
 
+    validated = dict(result)
+    validated["score"] = clamped_score
+    validated["confidence"] = raw_confidence if confidence_valid else "low"
     return validated
 
 
+def _serialize_input(data) -> tuple[str, str]:
+    """Serialise an analysis input once, returning ``(json_text, sha256_hex)``.
+
+    The same text is hashed for the cache key and stored as ``raw_data``.
+    """
+    text = json.dumps(data, sort_keys=True, default=str)
+    return text, hashlib.sha256(text.encode()).hexdigest()
+
+
 def create_llm_provider(backend: str) -> LLMProvider:
     """Create an LLM provider instance by backend name."""
     if backend == "claude":
@@ -173,9 +193,7 @@ class AnalysisEngine:
         ]
 
         for category, prompt_fn, data in categories:
-            input_hash = hashlib.sha256(
-                json.dumps(data, sort_keys=True, default=str).encode()
-            ).hexdigest()
+            raw_data, input_hash = _serialize_input(data)
             cached = await self.db.get_cached_analysis(symbol, category, input_hash)
             if cached:
                 yield RefreshProgress(symbol=symbol, step=f"Using cached {category}...", category=category)
@@ -207,16 +225,14 @@ class AnalysisEngine:
                 await self.db.save_analysis(
                     symbol=symbol, category=category, score=score,
                     confidence=confidence, narrative=cat_narrative,
-                    raw_data=json.dumps(data, default=str),
+                    raw_data=raw_data,
                     input_hash=input_hash,
                 )
 
             signal_results[category] = {"score": score, "confidence": confidence, "narrative": cat_narrative}
 
         # Sector context (needs sector param)
-        sector_hash = hashlib.sha256(
-            json.dumps(sector_data, sort_keys=True, default=str).encode()
-        ).hexdigest()
+        sector_raw, sector_hash = _serialize_input(sector_data)
         cached_sector = await self.db.get_cached_analysis(symbol, "sector_context", sector_hash)
         if cached_sector:
             yield RefreshProgress(symbol=symbol, step="Using cached sector context...", category="sector_context")
@@ -237,14 +253,12 @@ class AnalysisEngine:
             await self.db.save_analysis(
                 symbol=symbol, category="sector_context",
                 score=result["score"], confidence=result["confidence"],
-                narrative=result.get("narrative", ""), raw_data=json.dumps(sector_data, default=str),
+                narrative=result.get("narrative", ""), raw_data=sector_raw,
                 input_hash=sector_hash,
             )
 
         # Risk assessment
-        risk_hash = hashlib.sha256(
-            json.dumps(all_scraped, sort_keys=True, default=str).encode()
-        ).hexdigest()
+        risk_raw, risk_hash = _serialize_input(all_scraped)
         cached_risk = await self.db.get_cached_analysis(symbol, "risk_assessment", risk_hash)
         if cached_risk:
             yield RefreshProgress(symbol=symbol, step="Using cached risk assessment...", category="risk_assessment")
@@ -269,7 +283,7 @@ class AnalysisEngine:
             await self.db.save_analysis(
                 symbol=symbol, category="risk_assessment",
                 score=result["score"], confidence=result["confidence"],
-                narrative=result.get("narrative", ""), raw_data=json.dumps(all_scraped, default=str),
+                narrative=result.get("narrative", ""), raw_data=risk_raw,
                 input_hash=risk_hash,
             )
 
@@ -278,12 +292,13 @@ class AnalysisEngine:
         synthesis_prompt = prompts.synthesis_prompt(symbol, signal_results)
         synthesis = await self.llm.analyze(synthesis_prompt)
         
-        # Get configurable weights from settings
-        scoring_weights = await self.db.get_scoring_weights()
-        raw_overall = synthesis.get("overall_score", weighted_score(
-            {k: v["score"] for k, v in signal_results.items()},
-            weights=scoring_weights
-        ))
+        if "overall_score" in synthesis:
+            raw_overall = synthesis["overall_score"]
+        else:
+            # Fall back to the configurable weights from settings
+            scoring_weights = await self.db.get_scoring_weights()
+            signal_scores = {k: v["score"] for k, v in signal_results.items()}
+            raw_overall = weighted_score(signal_scores, weights=scoring_weights)
         overall_score = max(-10, min(10, raw_overall))
         if overall_score != raw_overall:
             logger.warning(
@@ -1,3 +1,7 @@
+import math
+
+import numpy as np
+
 # Default category weights (can be overridden via settings)
 DEFAULT_CATEGORY_WEIGHTS = {
     "fundamentals": 0.20,
@@ -9,6 +13,23 @@ DEFAULT_CATEGORY_WEIGHTS = {
     "risk_assessment": 0.15,
 }
 
+# Categories every weights dict must provide
+_REQUIRED_CATEGORIES = frozenset(DEFAULT_CATEGORY_WEIGHTS)
+# Allowed absolute deviation of a weight sum from 1.0; loose enough for
+# slider input (which is normalised on save), tight enough to catch typos
+_WEIGHT_SUM_TOL = 0.01
+
+# Score thresholds for buy/sell recommendations (inclusive)
+BUY_THRESHOLD = 3.0
+SELL_THRESHOLD = -3.0
+# Recommendation labels
+BUY, HOLD, SELL = "buy", "hold", "sell"
+_RECOMMENDATION_LABELS = np.array([SELL, HOLD, BUY], dtype=object)
+
+# Fixed column order for array-based scoring (see weighted_score_batch)
+_CATEGORY_ORDER = tuple(DEFAULT_CATEGORY_WEIGHTS)
+_DEFAULT_WEIGHT_VECTOR = np.array([DEFAULT_CATEGORY_WEIGHTS[k] for k in _CATEGORY_ORDER])
+
 # Preset configurations for different investment strategies
 SCORING_PRESETS = {
     "balanced": {
@@ -94,13 +115,52 @@ def weighted_score(signal_scores: dict[str, float], weights: dict[str, float] |
     return round(weighted_sum / total_weight, 2)
 
 
+def weighted_score_batch(
+    signal_matrix: np.ndarray, weights: dict[str, float] | None = None,
+) -> np.ndarray:
+    """Vectorised :func:`weighted_score` for many stocks at once.
+
+    Args:
+        signal_matrix: Array of shape ``(n_stocks, len(_CATEGORY_ORDER))``
+            with columns in ``_CATEGORY_ORDER``. ``NaN`` marks a missing
+            category, which (as in ``weighted_score``) is left out of both
+            the weighted sum and the total weight.
+        weights: Optional custom weights. If None, uses DEFAULT_CATEGORY_WEIGHTS.
+
+    Returns:
+        Array of weighted average scores rounded to 2 decimal places
+        (0.0 for rows with no scores). The terms are summed in a different
+        order from ``weighted_score``, so a score on a rounding boundary may
+        differ from it by 0.01.
+    """
+    if weights is None:
+        w = _DEFAULT_WEIGHT_VECTOR
+    else:
+        w = np.array([weights.get(k, 0.1) for k in _CATEGORY_ORDER])
+    scores = np.asarray(signal_matrix, dtype=float)
+    present = ~np.isnan(scores)
+    weighted_sum = np.where(present, scores, 0.0) @ w
+    total_weight = present @ w
+    safe_total = np.where(total_weight == 0, 1.0, total_weight)
+    return np.where(total_weight == 0, 0.0, np.round(weighted_sum / safe_total, 2))
+
+
 def score_to_recommendation(score: float) -> str:
     """Convert numeric score to buy/hold/sell recommendation."""
-    if score >= 3.0:
-        return "buy"
-    elif score <= -3.0:
-        return "sell"
-    return "hold"
+    if score >= BUY_THRESHOLD:
+        return BUY
+    elif score <= SELL_THRESHOLD:
+        return SELL
+    return HOLD
+
+
+def scores_to_recommendations(scores: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`score_to_recommendation` over an array of scores."""
+    scores = np.asarray(scores)
+    # 0 = sell (<= SELL_THRESHOLD), 1 = hold, 2 = buy (>= BUY_THRESHOLD);
+    # NaN fails both comparisons and stays hold, as in the scalar version
+    idx = 1 + (scores >= BUY_THRESHOLD).astype(np.intp) - (scores <= SELL_THRESHOLD)
+    return _RECOMMENDATION_LABELS[idx]
 
 
 def validate_weights(weights: dict[str, float]) -> tuple[bool, str]:
@@ -112,17 +172,18 @@ def validate_weights(weights: dict[str, float]) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    required_categories = set(DEFAULT_CATEGORY_WEIGHTS.keys())
-    provided_categories = set(weights.keys())
-    
-    # Check all required categories are present
-    missing = required_categories - provided_categories
-    if missing:
-        return False, f"Missing categories: {', '.join(missing)}"
-    
-    # Check no extra categories
-    extra = provided_categories - required_categories
-    if extra:
+    provided_categories = weights.keys()
+
+    # A single set comparison covers the common case; the differences are
+    # only built to report which categories are wrong
+    if provided_categories != _REQUIRED_CATEGORIES:
+        # Check all required categories are present
+        missing = _REQUIRED_CATEGORIES - provided_categories
+        if missing:
+            return False, f"Missing categories: {', '.join(missing)}"
+
+        # Check no extra categories
+        extra = provided_categories - _REQUIRED_CATEGORIES
         return False, f"Unknown categories: {', '.join(extra)}"
     
     # Check all weights are positive numbers
@@ -132,9 +193,9 @@ def validate_weights(weights: dict[str, float]) -> tuple[bool, str]:
         if weight < 0:
             return False, f"Weight for {category} cannot be negative"
     
-    # Check sum is approximately 1.0 (allowing small floating point误差)
-    total = sum(weights.values())
-    if not (0.99 <= total <= 1.01):
+    # Check sum is approximately 1.0 (fsum avoids accumulated rounding error)
+    total = math.fsum(weights.values())
+    if not math.isclose(total, 1.0, rel_tol=0.0, abs_tol=_WEIGHT_SUM_TOL):
         return False, f"Weights must sum to 100% (currently {total * 100:.1f}%)"
     
     return True, ""
@@ -142,7 +203,7 @@ def validate_weights(weights: dict[str, float]) -> tuple[bool, str]:
 
 def normalize_weights(weights: dict[str, float]) -> dict[str, float]:
     """Normalize weights so they sum exactly to 1.0."""
-    total = sum(weights.values())
+    total = math.fsum(weights.values())
     if total == 0:
         return DEFAULT_CATEGORY_WEIGHTS.copy()
     return {k: round(v / total, 4) for k, v in weights.items()}
@@ -230,8 +230,7 @@ async def update_weights(request: Request):
     normalized_weights = normalize_weights(weights)
     
     # Save to database
-    await db.set_scoring_weights(normalized_weights)
-    await db.set_active_preset("custom")
+    await db.set_settings(normalized_weights, "custom")
     
     return {"success": True, "weights": normalized_weights}
 
@@ -243,8 +242,7 @@ async def apply_preset(preset_name: str):
         return {"success": False, "error": f"Unknown preset: {preset_name}"}
     
     preset = SCORING_PRESETS[preset_name]
-    await db.set_scoring_weights(preset["weights"])
-    await db.set_active_preset(preset_name)
+    await db.set_settings(preset["weights"], preset_name)
     
     return {
         "success": True,
@@ -253,16 +251,20 @@ async def apply_preset(preset_name: str):
     }
 
 
+# Presets are static, so the listing response is built once at import
+_PRESETS_RESPONSE = {
+    "presets": {
+        name: {
+            "name": data["name"],
+            "description": data["description"],
+            "weights": data["weights"],
+        }
+        for name, data in SCORING_PRESETS.items()
+    }
+}
+
+
 @app.get("/api/settings/presets")
 async def get_presets():
     """Get all available scoring presets."""
-    return {
-        "presets": {
-            name: {
-                "name": data["name"],
-                "description": data["description"],
-                "weights": data["weights"],
-            }
-            for name, data in SCORING_PRESETS.items()
-        }
-    }
+    return _PRESETS_RESPONSE
@@ -1,11 +1,26 @@
 import asyncio
+import json
+import logging
 
 import aiosqlite
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib parser gives the same result
+    orjson = None
+
+from src.analysis.scoring import DEFAULT_CATEGORY_WEIGHTS
+
 ALEMBIC_DIR = Path(__file__).resolve().parent.parent / "alembic"
 ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
 
+logger = logging.getLogger(__name__)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+# the stdlib exception either way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class Database:
     def __init__(self, db_path: str = "data/stock_selector.db"):
@@ -185,8 +200,8 @@ class Database:
         row = await cursor.fetchone()
         return row["value"] if row else None
 
-    async def set_setting(self, key: str, value: str) -> None:
-        """Set a setting value by key (insert or update)."""
+    async def _upsert_setting(self, key: str, value: str) -> None:
+        """Insert or update a setting without committing."""
         await self.db.execute(
             """INSERT INTO settings (key, value, updated_at) 
                VALUES (?, ?, datetime('now'))
@@ -195,47 +210,36 @@ class Database:
                updated_at = datetime('now')""",
             (key, value)
         )
+
+    async def set_setting(self, key: str, value: str) -> None:
+        """Set a setting value by key (insert or update)."""
+        await self._upsert_setting(key, value)
         await self.db.commit()
 
     async def get_scoring_weights(self) -> dict[str, float]:
         """Get scoring weights from settings or return defaults."""
-        import json
-        
-        weights_json = await self.get_setting("scoring_weights")
-        if weights_json:
+        value = await self.get_setting("scoring_weights")
+        if value:
             try:
-                weights = json.loads(weights_json)
-                # Validate that all required keys are present
-                default_weights = {
-                    "fundamentals": 0.20,
-                    "analyst_consensus": 0.15,
-                    "insider_activity": 0.10,
-                    "technicals": 0.20,
-                    "sentiment": 0.10,
-                    "sector_context": 0.10,
-                    "risk_assessment": 0.15,
-                }
                 # Merge with defaults to ensure all keys exist
-                return {**default_weights, **weights}
-            except json.JSONDecodeError:
-                pass
+                return {**DEFAULT_CATEGORY_WEIGHTS, **_json_loads(value)}
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning("Ignoring unreadable scoring weights setting; using defaults")
         
-        # Return default weights if no settings or invalid JSON
-        return {
-            "fundamentals": 0.20,
-            "analyst_consensus": 0.15,
-            "insider_activity": 0.10,
-            "technicals": 0.20,
-            "sentiment": 0.10,
-            "sector_context": 0.10,
-            "risk_assessment": 0.15,
-        }
+        # Return default weights if no settings or invalid data
+        return DEFAULT_CATEGORY_WEIGHTS.copy()
 
     async def set_scoring_weights(self, weights: dict[str, float]) -> None:
         """Save scoring weights to settings."""
-        import json
         await self.set_setting("scoring_weights", json.dumps(weights))
 
+    async def set_settings(self, weights: dict[str, float], preset: str | None = None) -> None:
+        """Save scoring weights and, if given, the active preset in one transaction."""
+        await self._upsert_setting("scoring_weights", json.dumps(weights))
+        if preset is not None:
+            await self._upsert_setting("active_preset", preset)
+        await self.db.commit()
+
     async def get_active_preset(self) -> str | None:
         """Get the active scoring preset name."""
         return await self.get_setting("active_preset")
@@ -1,10 +1,24 @@
+import asyncio
 import logging
 import re
+from urllib.parse import urljoin
 
 from src.scrapers.base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Announcement links on the listing page
+_ANNOUNCEMENT_SELECTOR = 'a[href*="/announcement/"]'
+# Date patterns (DD/MM/YYYY, YYYY-MM-DD, etc.) near an announcement link
+_DATE_RE = re.compile(r'\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}|\d{4}[/\-]\d{1,2}[/\-]\d{1,2}')
+
+# Structured fields in the RNS detail text
+_DIRECTOR_RE = re.compile(r"(?:Director|PDMR)\s*:\s*([^\n]+)", re.IGNORECASE)
+_TRADE_TYPE_RE = re.compile(r"(?:Nature of transaction|Type)[:\s]+(Purchase|Sale|Buy|Sell|Award)", re.IGNORECASE)
+_SHARES_RE = re.compile(r"(?:Number of (?:shares|securities)|Shares)[:\s]+([\d,]+)", re.IGNORECASE)
+_PRICE_RE = re.compile(r"(?:Price per share|Price)[:\s]+([£\d.,]+)", re.IGNORECASE)
+_VALUE_RE = re.compile(r"(?:Aggregate value|Value|Total)[:\s]+([£\d.,]+)", re.IGNORECASE)
+
 
 class InvestegateScraper(BaseScraper):
     """Scrape UK director dealings from Investegate."""
@@ -21,48 +35,35 @@ class InvestegateScraper(BaseScraper):
 
         matching_links = []
         
-        # Look for all announcement links and filter by symbol
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            text = str(link.get_text(strip=True)).upper()
-            
-            # Check if this is an announcement link (updated pattern)
-            href_str = str(href)
-            if "/announcement/" in href_str:
-                # Check if symbol appears in text or URL
-                if bare_symbol in text or bare_symbol in href_str.upper():
-                    # Initialize date for this link
-                    date = ""
-                    # Get the parent container to find date info
-                    parent = link.find_parent()
-                    # Try to find date in parent or nearby elements
-                    for elem in [parent, link.find_previous(), link.find_next()]:
-                        if elem:
-                            elem_text = elem.get_text(strip=True)
-                            # Look for date patterns (YYYY-MM-DD, DD/MM/YYYY, etc.)
-                            date_match = re.search(r'\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}|\d{4}[/\-]\d{1,2}[/\-]\d{1,2}', elem_text)
-                            if date_match:
-                                date = date_match.group()
-                                break
-                    
-                    href_str = str(href)
-                    if not str(href_str).startswith("http"):
-                        full_href = self.BASE_URL + str(href_str).lstrip("/")
-                    else:
-                        full_href = href_str
-                    
-                    matching_links.append({
-                        "url": full_href,
-                        "headline": link.get_text(strip=True),
-                        "date": date,
-                    })
-
-        # Fetch detail pages for top 5 matching announcements
-        trades = []
-        for item in matching_links[:5]:
-            trade = await self._parse_detail(item)
-            if trade:
-                trades.append(trade)
+        # Look for announcement links and filter by symbol
+        for link in soup.select(_ANNOUNCEMENT_SELECTOR):
+            href = str(link.get("href", ""))
+            text = link.get_text(strip=True)
+
+            # Check if symbol appears in text or URL
+            if bare_symbol not in text.upper() and bare_symbol not in href.upper():
+                continue
+
+            # Try to find a date in the parent or nearby elements
+            date = ""
+            for elem in [link.find_parent(), link.find_previous(), link.find_next()]:
+                if elem:
+                    date_match = _DATE_RE.search(elem.get_text(strip=True))
+                    if date_match:
+                        date = date_match.group()
+                        break
+
+            matching_links.append({
+                "url": urljoin(self.BASE_URL, href),
+                "headline": text,
+                "date": date,
+            })
+
+        # Parse detail pages for top 5 matching announcements together. Live
+        # fetches are still serialised by BaseScraper.fetch's per-domain lock
+        # and interval; only cache hits and parsing overlap.
+        results = await asyncio.gather(*(self._parse_detail(item) for item in matching_links[:5]))
+        trades = [trade for trade in results if trade]
 
         return {"insider_trades": trades}
 
@@ -88,11 +89,11 @@ class InvestegateScraper(BaseScraper):
         body = soup.get_text("\n", strip=True)
 
         # Try to extract structured fields from the RNS text
-        director = self._extract_field(body, r"(?:Director|PDMR)\s*:\s*([^\n]+)")
-        trade_type = self._extract_field(body, r"(?:Nature of transaction|Type)[:\s]+(Purchase|Sale|Buy|Sell|Award)")
-        shares = self._extract_field(body, r"(?:Number of (?:shares|securities)|Shares)[:\s]+([\d,]+)")
-        price = self._extract_field(body, r"(?:Price per share|Price)[:\s]+([£\d.,]+)")
-        value = self._extract_field(body, r"(?:Aggregate value|Value|Total)[:\s]+([£\d.,]+)")
+        director = self._extract_field(body, _DIRECTOR_RE)
+        trade_type = self._extract_field(body, _TRADE_TYPE_RE)
+        shares = self._extract_field(body, _SHARES_RE)
+        price = self._extract_field(body, _PRICE_RE)
+        value = self._extract_field(body, _VALUE_RE)
 
         return {
             "filing_date": item.get("date", ""),
@@ -107,6 +108,6 @@ class InvestegateScraper(BaseScraper):
         }
 
     @staticmethod
-    def _extract_field(text: str, pattern: str) -> str | None:
-        match = re.search(pattern, text, re.IGNORECASE)
+    def _extract_field(text: str, pattern: re.Pattern[str]) -> str | None:
+        match = pattern.search(text)
         return match.group(1).strip() if match else None
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -18,6 +23,19 @@ logger = logging.getLogger(__name__)
 
 _UK_EXCHANGES: set[str] = {"LSE"}
 
+# yfinance symbol suffix → market; unsuffixed or other symbols are US
+_SUFFIX_TO_MARKET: dict[str, str] = {"L": "UK", "LN": "UK"}
+
+# Maximum number of (symbol, preferred_market) resolutions kept in memory
+_RESOLVE_CACHE_MAX = 4096
+# Maximum number of symbols whose info/history/news are kept in memory
+_TICKER_CACHE_MAX = 256
+# Seconds before a symbol's cached info/history/news are fetched again
+_TICKER_CACHE_TTL = 300.0
+# Clock for cache ages; a module attribute so tests can patch it without
+# touching the time module the event loop relies on
+_now = time.monotonic
+
 # ---------------------------------------------------------------------------
 # Mapping helpers — translate yfinance Ticker.info keys → our dict keys
 # ---------------------------------------------------------------------------
@@ -66,6 +84,17 @@ _ANALYST_MAP: dict[str, str] = {
 }
 
 
+# History columns used by get_technicals
+_HISTORY_COLUMNS = ["High", "Low", "Close"]
+
+# Indicator windows used by get_technicals
+_SMA_WINDOWS = (("SMA20", 20), ("SMA50", 50), ("SMA200", 200))
+_RSI_WINDOW = 14
+_ATR_WINDOW = 14
+_BOLLINGER_WINDOW = 20
+_BOLLINGER_STD = 2.0
+
+
 def _fmt(val: Any) -> str:
     """Coerce a value to a display string, matching Finviz-like formatting."""
     if val is None:
@@ -79,12 +108,12 @@ def _fmt(val: Any) -> str:
 
 
 def _map_info(info: dict, mapping: dict[str, str]) -> dict[str, str]:
-    out: dict[str, str] = {}
-    for yf_key, our_key in mapping.items():
-        val = info.get(yf_key)
-        if val is not None:
-            out[our_key] = _fmt(val)
-    return out
+    # Missing and None values are skipped rather than formatted as "-"
+    return {
+        our_key: _fmt(val)
+        for yf_key, our_key in mapping.items()
+        if (val := info.get(yf_key)) is not None
+    }
 
 
 def _pct(val: float | None) -> str:
@@ -93,6 +122,19 @@ def _pct(val: float | None) -> str:
     return f"{val:.2f}%"
 
 
+def _market_for_symbol(symbol: str) -> str:
+    """Return the market implied by *symbol*'s exchange suffix."""
+    _, sep, suffix = symbol.rpartition(".")
+    return _SUFFIX_TO_MARKET.get(suffix, "US") if sep else "US"
+
+
+def _last_valid(series: pd.Series) -> float | None:
+    """Return the last non-NaN value of *series*, or None if there is none."""
+    values = series.to_numpy(dtype=float)
+    valid = np.flatnonzero(~np.isnan(values))
+    return float(values[valid[-1]]) if valid.size else None
+
+
 # ---------------------------------------------------------------------------
 # Provider
 # ---------------------------------------------------------------------------
@@ -104,11 +146,19 @@ class YFinanceProvider:
     Implements the :class:`DataProvider` protocol.
     """
 
+    MAX_CONCURRENT_FETCHES = 8  # tickers fetched at once by get_many_fundamentals
+
     def __init__(self) -> None:
-        # per-symbol in-memory cache so we don't hit yfinance twice
-        self._cache: dict[str, dict] = {}
-        # resolved symbol → market mapping
-        self._resolved: dict[str, tuple[str, str]] = {}
+        # per-symbol in-memory cache so we don't hit yfinance twice, LRU-bounded
+        self._cache: OrderedDict[str, dict] = OrderedDict()
+        # misses are fetched from worker threads (see _get_cached)
+        self._cache_lock = threading.Lock()
+        # (raw symbol, preferred market) → (resolved symbol, market), LRU-bounded
+        self._resolve_cache: OrderedDict[tuple[str, str | None], tuple[str, str]] = OrderedDict()
+        # resolve_symbols() resolves from worker threads
+        self._resolve_lock = threading.Lock()
+        # single-slot cache of the last successful probe: (symbol, info)
+        self._last_probe: tuple[str, dict | None] = ("", None)
 
     # -- internal helpers ---------------------------------------------------
 
@@ -117,12 +167,18 @@ class YFinanceProvider:
 
     def _probe_symbol(self, symbol: str) -> dict | None:
         """Return Ticker.info if *symbol* appears valid, else None."""
+        last_symbol, last_info = self._last_probe
+        if last_symbol == symbol:
+            return last_info
         try:
             ticker = self._get_ticker(symbol)
             info = ticker.info or {}
             # yfinance returns an info dict even for invalid symbols, but
             # it won't have a market price.
             if info.get("regularMarketPrice") or info.get("currentPrice"):
+                # Only successful probes are remembered, so a transient
+                # failure is retried on the next call.
+                self._last_probe = (symbol, info)
                 return info
         except Exception:
             pass
@@ -138,34 +194,70 @@ class YFinanceProvider:
             raw_symbol: The symbol to resolve
             preferred_market: If "UK", prioritize UK symbols even if US symbol exists
         """
-        if raw_symbol in self._resolved:
-            return self._resolved[raw_symbol]
+        key = (raw_symbol, preferred_market)
+        with self._resolve_lock:
+            cached = self._resolve_cache.get(key)
+            if cached is not None:
+                self._resolve_cache.move_to_end(key)
+                return cached
 
         # If UK is preferred, search LSE first
         if preferred_market == "UK":
             uk_result = self._search_symbol(raw_symbol, "LSE")
             if uk_result:
                 uk_symbol, _ = uk_result
-                self._resolved[raw_symbol] = (uk_symbol, "UK")
-                return uk_symbol, "UK"
+                return self._remember_resolution(key, (uk_symbol, "UK"))
 
         # Try as-is (covers US tickers and already-suffixed UK tickers)
         info = self._probe_symbol(raw_symbol)
         if info:
-            market = "UK" if raw_symbol.endswith((".L", ".LN")) else "US"
-            self._resolved[raw_symbol] = (raw_symbol, market)
-            return raw_symbol, market
+            market = _market_for_symbol(raw_symbol)
+            return self._remember_resolution(key, (raw_symbol, market))
 
         # If we haven't searched UK yet, try now as a fallback
         if preferred_market != "UK":
             uk_result = self._search_symbol(raw_symbol, "LSE")
             if uk_result:
                 uk_symbol, _ = uk_result
-                self._resolved[raw_symbol] = (uk_symbol, "UK")
-                return uk_symbol, "UK"
+                return self._remember_resolution(key, (uk_symbol, "UK"))
 
         raise ValueError(f"Ticker '{raw_symbol}' not found on US or UK exchanges")
 
+    def _remember_resolution(
+        self, key: tuple[str, str | None], result: tuple[str, str],
+    ) -> tuple[str, str]:
+        """Store *result* in the resolution cache, evicting the least recently used entry."""
+        with self._resolve_lock:
+            self._resolve_cache[key] = result
+            if len(self._resolve_cache) > _RESOLVE_CACHE_MAX:
+                self._resolve_cache.popitem(last=False)
+        return result
+
+    async def resolve_symbols(
+        self, raw_symbols: list[str], preferred_market: str | None = None,
+    ) -> dict[str, tuple[str, str]]:
+        """Resolve many symbols concurrently.
+
+        Each :meth:`resolve_symbol` call (blocking yfinance I/O) runs in a
+        worker thread and all of them are awaited together, so N symbols
+        cost roughly one round-trip window instead of N.
+
+        Returns a dict mapping each raw symbol to ``(resolved_symbol, market)``.
+        Symbols that cannot be resolved are omitted.
+        """
+        unique = list(dict.fromkeys(raw_symbols))
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.resolve_symbol, sym, preferred_market) for sym in unique),
+            return_exceptions=True,
+        )
+        resolved: dict[str, tuple[str, str]] = {}
+        for sym, result in zip(unique, results):
+            if isinstance(result, BaseException):
+                logger.debug("Could not resolve %s: %s", sym, result)
+                continue
+            resolved[sym] = result
+        return resolved
+
     def _search_symbol(self, query: str, exchange: str) -> tuple[str, dict] | None:
         """Search for *query* on *exchange* using ``yf.Search``.
 
@@ -173,7 +265,11 @@ class YFinanceProvider:
         ``_probe_symbol`` succeeds, or ``None``.
         """
         try:
-            results = yf.Search(query)
+            # Only quotes are used; skip the news/lists/recommendation payloads.
+            # yfinance already reuses one pooled HTTP session across calls.
+            results = yf.Search(
+                query, news_count=0, lists_count=0, include_cb=False, recommended=0,
+            )
             quotes = getattr(results, "quotes", None) or []
             for quote in quotes:
                 if quote.get("exchange") != exchange:
@@ -189,15 +285,34 @@ class YFinanceProvider:
             logger.debug("yf.Search(%r) failed", query, exc_info=True)
         return None
 
+    def _cache_lookup(self, symbol: str) -> dict | None:
+        """Return fresh cached data for *symbol*, marking it most recently used.
+
+        Entries older than ``_TICKER_CACHE_TTL`` are dropped and ``None`` is
+        returned so the caller refetches.
+        """
+        with self._cache_lock:
+            data = self._cache.get(symbol)
+            if data is None:
+                return None
+            if _now() - data["fetched_at"] >= _TICKER_CACHE_TTL:
+                del self._cache[symbol]
+                return None
+            self._cache.move_to_end(symbol)
+            return data
+
     def _ensure_cached(self, symbol: str) -> dict:
         """Fetch and cache info + history for *symbol*."""
-        if symbol in self._cache:
-            return self._cache[symbol]
+        data = self._cache_lookup(symbol)
+        if data is not None:
+            return data
 
         ticker = self._get_ticker(symbol)
         info = ticker.info or {}
         try:
             hist: pd.DataFrame = ticker.history(period="1y")
+            # Only the price columns feed the indicators; don't cache the rest
+            hist = hist[hist.columns.intersection(_HISTORY_COLUMNS)]
         except Exception:
             hist = pd.DataFrame()
         try:
@@ -205,17 +320,55 @@ class YFinanceProvider:
         except Exception:
             news = []
 
-        self._cache[symbol] = {"info": info, "hist": hist, "news": news}
-        return self._cache[symbol]
+        data = {"info": info, "hist": hist, "news": news, "fetched_at": _now()}
+        with self._cache_lock:
+            self._cache[symbol] = data
+            if len(self._cache) > _TICKER_CACHE_MAX:
+                self._cache.popitem(last=False)
+        return data
+
+    async def _get_cached(self, symbol: str) -> dict:
+        """Async :meth:`_ensure_cached`; a cache miss is fetched in a worker thread."""
+        data = self._cache_lookup(symbol)
+        if data is None:
+            data = await asyncio.to_thread(self._ensure_cached, symbol)
+        return data
 
     # -- DataProvider interface ---------------------------------------------
 
     async def get_fundamentals(self, symbol: str) -> dict:
-        data = self._ensure_cached(symbol)
+        data = await self._get_cached(symbol)
         return _map_info(data["info"], _FUNDAMENTAL_MAP)
 
+    async def get_many_fundamentals(self, symbols: list[str]) -> dict[str, dict]:
+        """Fetch fundamentals for many symbols concurrently.
+
+        At most ``MAX_CONCURRENT_FETCHES`` tickers are fetched at once.
+        Returns a dict mapping each symbol to its fundamentals; symbols
+        whose fetch fails are omitted.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+
+        async def _fetch(symbol: str) -> dict:
+            async with semaphore:
+                return await self.get_fundamentals(symbol)
+
+        unique = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(*(_fetch(sym) for sym in unique), return_exceptions=True)
+        fundamentals: dict[str, dict] = {}
+        for sym, result in zip(unique, results):
+            if isinstance(result, BaseException):
+                logger.debug("Could not fetch fundamentals for %s: %s", sym, result)
+                continue
+            fundamentals[sym] = result
+        return fundamentals
+
     async def get_technicals(self, symbol: str) -> dict:
-        data = self._ensure_cached(symbol)
+        data = await self._get_cached(symbol)
+        # Indicators are derived from the cached history alone, so they live
+        # (and are cleared) with the same cache entry
+        if "technicals" in data:
+            return dict(data["technicals"])
         info = data["info"]
         hist: pd.DataFrame = data["hist"]
 
@@ -258,28 +411,39 @@ class YFinanceProvider:
         if not hist.empty and "Close" in hist.columns:
             close = hist["Close"]
 
-            sma20 = sma(close, 20)
-            sma50 = sma(close, 50)
-            sma200 = sma(close, 200)
-
-            if sma20.notna().any():
-                last_sma20 = sma20.dropna().iloc[-1]
-                technicals["SMA20"] = _pct((price - last_sma20) / last_sma20 * 100) if price else _fmt(last_sma20)
-            if sma50.notna().any():
-                last_sma50 = sma50.dropna().iloc[-1]
-                technicals["SMA50"] = _pct((price - last_sma50) / last_sma50 * 100) if price else _fmt(last_sma50)
-            if sma200.notna().any():
-                last_sma200 = sma200.dropna().iloc[-1]
-                technicals["SMA200"] = _pct((price - last_sma200) / last_sma200 * 100) if price else _fmt(last_sma200)
-
-            rsi_series = rsi(close)
-            if rsi_series.notna().any():
-                technicals["RSI (14)"] = f"{rsi_series.dropna().iloc[-1]:.2f}"
-
-            if {"High", "Low", "Close"}.issubset(hist.columns):
-                atr_series = atr(hist["High"], hist["Low"], close)
-                if atr_series.notna().any():
-                    technicals["ATR (14)"] = _fmt(atr_series.dropna().iloc[-1])
+            n_rows = len(close)
+            close_values = close.to_numpy(dtype=float)
+
+            # Each indicator is skipped outright when the history is too
+            # short to fill its window, rather than computed as all-NaN
+            for label, period in _SMA_WINDOWS:
+                if n_rows < period:
+                    continue
+                # Only the latest SMA is reported, so average the last window
+                # directly; fall back to the rolling series across gaps
+                window = close_values[-period:]
+                if np.isnan(window).any():
+                    last_sma = _last_valid(sma(close, period))
+                else:
+                    last_sma = float(window.mean())
+                if last_sma is None:
+                    continue
+                # A zero average (e.g. an all-zero history) has no relative distance
+                if price and last_sma:
+                    technicals[label] = _pct((price - last_sma) / last_sma * 100)
+                else:
+                    technicals[label] = _fmt(last_sma)
+
+            # RSI works on price changes, so it needs one row more than its window
+            if n_rows > _RSI_WINDOW:
+                last_rsi = _last_valid(rsi(close, _RSI_WINDOW))
+                if last_rsi is not None:
+                    technicals["RSI (14)"] = f"{last_rsi:.2f}"
+
+            if n_rows >= _ATR_WINDOW and {"High", "Low", "Close"}.issubset(hist.columns):
+                last_atr = _last_valid(atr(hist["High"], hist["Low"], close, _ATR_WINDOW))
+                if last_atr is not None:
+                    technicals["ATR (14)"] = _fmt(last_atr)
 
             # Performance periods
             def _perf(days: int) -> str | None:
@@ -297,15 +461,17 @@ class YFinanceProvider:
                     technicals[label] = val
 
             # Volatility from Bollinger bandwidth
-            upper, middle, lower = bollinger_bands(close)
-            if middle.notna().any() and upper.notna().any():
-                bw = (upper.iloc[-1] - lower.iloc[-1]) / middle.iloc[-1] * 100
-                technicals["Volatility"] = _pct(bw)
+            if n_rows >= _BOLLINGER_WINDOW:
+                upper, middle, lower = bollinger_bands(close, _BOLLINGER_WINDOW, _BOLLINGER_STD)
+                if middle.notna().any() and upper.notna().any():
+                    bw = (upper.iloc[-1] - lower.iloc[-1]) / middle.iloc[-1] * 100
+                    technicals["Volatility"] = _pct(bw)
 
-        return technicals
+        data["technicals"] = technicals
+        return dict(technicals)
 
     async def get_analyst_data(self, symbol: str) -> dict:
-        data = self._ensure_cached(symbol)
+        data = await self._get_cached(symbol)
         info = data["info"]
         result = _map_info(info, _ANALYST_MAP)
 
@@ -330,7 +496,7 @@ class YFinanceProvider:
         return result
 
     async def get_news(self, symbol: str) -> list[dict]:
-        data = self._ensure_cached(symbol)
+        data = await self._get_cached(symbol)
         raw_news = data.get("news", [])
         items: list[dict] = []
         for article in raw_news:
@@ -343,10 +509,13 @@ class YFinanceProvider:
         return items
 
     def clear_cache(self, symbol: str | None = None) -> None:
-        if symbol is None:
-            self._cache.clear()
-        else:
-            self._cache.pop(symbol, None)
+        if symbol is None or self._last_probe[0] == symbol:
+            self._last_probe = ("", None)
+        with self._cache_lock:
+            if symbol is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(symbol, None)
 
     async def get_sector_info(self, symbol: str) -> dict[str, str | None]:
         """Fetch sector and industry information for a symbol.
@@ -0,0 +1,14 @@
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create one test client shared by every API test.
+
+    The client is not entered as a context manager, so the app lifespan
+    (and with it the real ``db.init()``) never runs; tests patch
+    ``src.api.routes.db`` instead.
+    """
+    from src.api.routes import app
+    return TestClient(app)
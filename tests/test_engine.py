@@ -1,3 +1,4 @@
+import hashlib
 import json
 import pytest
 import pytest_asyncio
@@ -285,3 +286,12 @@ async def test_cached_analysis_stored_with_hash(db, engine):
     for a in analyses:
         assert a["input_hash"] is not None
         assert len(a["input_hash"]) == 64  # SHA-256 hex digest
+
+
+@pytest.mark.asyncio
+async def test_raw_data_is_the_hashed_serialisation(db, engine):
+    await db.add_ticker("AAPL", "Apple Inc.", "Technology")
+    await _collect(engine, "AAPL")
+
+    for a in await db.get_analyses("AAPL"):
+        assert a["input_hash"] == hashlib.sha256(a["raw_data"].encode()).hexdigest()
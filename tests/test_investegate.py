@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from src.scrapers.investegate import InvestegateScraper
 
 
@@ -119,3 +120,26 @@ async def test_scrape_no_matches_returns_empty(httpx_mock):
 
     assert result == {"insider_trades": []}
     await scraper.close()
+
+
+@pytest.mark.asyncio
+async def test_scrape_large_index_selects_matching_announcements():
+    """Only announcement links naming the symbol are followed, with absolute URLs."""
+    links = "".join(
+        f'<a href="/announcement/rns/other-plc--oth/director-dealing/{i}">OTH: Director Dealing</a>'
+        f'<a href="/news/{i}">VOD in the news</a>'
+        for i in range(5000)
+    )
+    links += '<a href="/announcement/rns/vodafone-group--vod/director-dealing/1">VOD: Director Dealing</a>'
+    listing = f"<html><body>{links}</body></html>"
+
+    scraper = InvestegateScraper()
+    with patch.object(scraper, "fetch", return_value=listing), \
+         patch.object(scraper, "_parse_detail", side_effect=lambda item: item) as mock_detail:
+        result = await scraper.scrape("VOD.L")
+
+    mock_detail.assert_called_once()
+    assert result["insider_trades"][0]["url"] == (
+        "https://www.investegate.co.uk/announcement/rns/vodafone-group--vod/director-dealing/1"
+    )
+    await scraper.close()
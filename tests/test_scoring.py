@@ -1,5 +1,16 @@
+import numpy as np
 import pytest
-from src.analysis.scoring import weighted_score, score_to_recommendation, DEFAULT_CATEGORY_WEIGHTS
+from src.analysis.scoring import (
+    weighted_score,
+    weighted_score_batch,
+    score_to_recommendation,
+    scores_to_recommendations,
+    DEFAULT_CATEGORY_WEIGHTS,
+)
+
+# weighted_score() of the varied scores below under DEFAULT_CATEGORY_WEIGHTS;
+# test_default_weights_unchanged guards against the weights drifting.
+VARIED_SCORES_EXPECTED = 4.95
 
 
 # --- DEFAULT_CATEGORY_WEIGHTS tests ---
@@ -16,6 +27,18 @@ def test_category_weights_sum_to_one():
     assert round(sum(DEFAULT_CATEGORY_WEIGHTS.values()), 10) == 1.0
 
 
+def test_default_weights_unchanged():
+    assert DEFAULT_CATEGORY_WEIGHTS == {
+        "fundamentals": 0.20,
+        "analyst_consensus": 0.15,
+        "insider_activity": 0.10,
+        "technicals": 0.20,
+        "sentiment": 0.10,
+        "sector_context": 0.10,
+        "risk_assessment": 0.15,
+    }
+
+
 # --- weighted_score tests ---
 
 def test_weighted_score_all_categories():
@@ -33,10 +56,7 @@ def test_weighted_score_varied_scores():
         "sector_context": 4.0,
         "risk_assessment": 5.0,
     }
-    expected = sum(
-        scores[k] * DEFAULT_CATEGORY_WEIGHTS[k] for k in scores
-    ) / sum(DEFAULT_CATEGORY_WEIGHTS[k] for k in scores)
-    assert weighted_score(scores) == round(expected, 2)
+    assert weighted_score(scores) == VARIED_SCORES_EXPECTED
 
 
 def test_weighted_score_subset_of_categories():
@@ -64,31 +84,57 @@ def test_weighted_score_rounds_to_two_decimals():
     assert result == round(result, 2)
 
 
-# --- score_to_recommendation tests ---
-
-def test_recommendation_buy():
-    assert score_to_recommendation(5.0) == "buy"
-
-
-def test_recommendation_sell():
-    assert score_to_recommendation(-5.0) == "sell"
+def test_weighted_score_batch_equivalence():
+    order = list(DEFAULT_CATEGORY_WEIGHTS)
+    rows = [
+        {"fundamentals": 8.0, "analyst_consensus": 6.0, "insider_activity": 2.0,
+         "technicals": 7.0, "sentiment": -3.0, "sector_context": 4.0, "risk_assessment": 5.0},
+        {k: 5.0 for k in order},
+        {"fundamentals": 10.0, "technicals": -10.0},
+        {"fundamentals": 3.33, "technicals": 6.67},
+        {},
+    ]
+    matrix = np.array([[row.get(k, np.nan) for k in order] for row in rows])
+    custom = {**DEFAULT_CATEGORY_WEIGHTS, "fundamentals": 0.5, "sentiment": 0.0}
+
+    for weights in (None, custom):
+        result = weighted_score_batch(matrix, weights)
+        assert result.tolist() == [weighted_score(row, weights) for row in rows]
+
+
+def test_weighted_score_batch_matches_random_rows():
+    order = list(DEFAULT_CATEGORY_WEIGHTS)
+    rng = np.random.default_rng(0)
+    matrix = np.round(rng.uniform(-10, 10, size=(20000, len(order))), 2)
+    matrix[rng.random(matrix.shape) < 0.2] = np.nan
+    rows = [
+        {k: v for k, v in zip(order, row) if not np.isnan(v)} for row in matrix.tolist()
+    ]
+    custom = {**DEFAULT_CATEGORY_WEIGHTS, "fundamentals": 0.5, "sentiment": 0.0}
+
+    for weights in (None, custom):
+        result = weighted_score_batch(matrix, weights)
+        expected = [weighted_score(row, weights) for row in rows]
+        # Summation order differs, so rounding-boundary rows may be 0.01 apart
+        np.testing.assert_allclose(result, expected, rtol=0, atol=0.01 + 1e-9)
 
 
-def test_recommendation_hold():
-    assert score_to_recommendation(0.0) == "hold"
-
-
-def test_recommendation_buy_boundary():
-    assert score_to_recommendation(3.0) == "buy"
-
-
-def test_recommendation_sell_boundary():
-    assert score_to_recommendation(-3.0) == "sell"
-
-
-def test_recommendation_hold_just_below_buy():
-    assert score_to_recommendation(2.99) == "hold"
-
+# --- score_to_recommendation tests ---
 
-def test_recommendation_hold_just_above_sell():
-    assert score_to_recommendation(-2.99) == "hold"
+@pytest.mark.parametrize("score,expected", [
+    (5.0, "buy"),
+    (-5.0, "sell"),
+    (0.0, "hold"),
+    (3.0, "buy"),      # buy boundary
+    (-3.0, "sell"),    # sell boundary
+    (2.99, "hold"),    # just below buy
+    (-2.99, "hold"),   # just above sell
+])
+def test_recommendation(score, expected):
+    assert score_to_recommendation(score) == expected
+
+
+def test_scores_to_recommendations_vector():
+    scores = np.concatenate([np.linspace(-10, 10, 10001), [3.0, -3.0, 2.99, -2.99, np.nan]])
+    result = scores_to_recommendations(scores)
+    assert result.tolist() == [score_to_recommendation(float(s)) for s in scores]
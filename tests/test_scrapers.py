@@ -1,4 +1,4 @@
-import pytest
+import pytest_asyncio
 from src.scrapers.base import BaseScraper
 
 
@@ -8,20 +8,24 @@ class FakeScraper(BaseScraper):
         return {"html_length": len(html)}
 
 
-@pytest.mark.asyncio
-async def test_base_scraper_fetch(httpx_mock):
+@pytest_asyncio.fixture(scope="module")
+async def fake_scraper():
+    """One FakeScraper (and httpx client) shared by every test in this module."""
+    scraper = FakeScraper()
+    yield scraper
+    await scraper.close()
+
+
+async def test_base_scraper_fetch(httpx_mock, fake_scraper):
     httpx_mock.add_response(
         url="https://example.com/quote/AAPL",
         text="<html><body>Apple Inc. $150</body></html>",
     )
-    scraper = FakeScraper()
-    result = await scraper.scrape("AAPL")
+    result = await fake_scraper.scrape("AAPL")
     assert result["html_length"] > 0
-    await scraper.close()
 
 
-@pytest.mark.asyncio
-async def test_base_scraper_cache_hit_skips_http(httpx_mock):
+async def test_base_scraper_cache_hit_skips_http(httpx_mock, fake_scraper, monkeypatch):
     """When cache returns content, no HTTP request should be made."""
     cached_html = "<html><body>Cached content</body></html>"
 
@@ -33,18 +37,17 @@ async def test_base_scraper_cache_hit_skips_http(httpx_mock):
     async def fake_cache_save(url: str, content: str):
         save_calls.append((url, content))
 
-    scraper = FakeScraper(cache_get=fake_cache_get, cache_save=fake_cache_save)
-    result = await scraper.scrape("AAPL")
+    monkeypatch.setattr(fake_scraper, "_cache_get", fake_cache_get)
+    monkeypatch.setattr(fake_scraper, "_cache_save", fake_cache_save)
+    result = await fake_scraper.scrape("AAPL")
     assert result["html_length"] == len(cached_html)
     # No HTTP request should have been made
     assert len(httpx_mock.get_requests()) == 0
     # No save should have been called (cache hit)
     assert len(save_calls) == 0
-    await scraper.close()
 
 
-@pytest.mark.asyncio
-async def test_base_scraper_cache_miss_fetches_and_saves(httpx_mock):
+async def test_base_scraper_cache_miss_fetches_and_saves(httpx_mock, fake_scraper, monkeypatch):
     """On cache miss, fetch via HTTP and save to cache."""
     live_html = "<html><body>Live content</body></html>"
     httpx_mock.add_response(
@@ -60,12 +63,12 @@ async def test_base_scraper_cache_miss_fetches_and_saves(httpx_mock):
     async def fake_cache_save(url: str, content: str):
         save_calls.append((url, content))
 
-    scraper = FakeScraper(cache_get=fake_cache_get, cache_save=fake_cache_save)
-    result = await scraper.scrape("AAPL")
+    monkeypatch.setattr(fake_scraper, "_cache_get", fake_cache_get)
+    monkeypatch.setattr(fake_scraper, "_cache_save", fake_cache_save)
+    result = await fake_scraper.scrape("AAPL")
     assert result["html_length"] == len(live_html)
     # HTTP request was made
     assert len(httpx_mock.get_requests()) == 1
     # Content was saved to cache
     assert len(save_calls) == 1
     assert save_calls[0] == ("https://example.com/quote/AAPL", live_html)
-    await scraper.close()
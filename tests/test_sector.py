@@ -1,6 +1,7 @@
 import re
 
 import pytest
+import pytest_asyncio
 from src.scrapers.sector import SectorScraper, SECTOR_ETFS, UK_SECTOR_ETFS
 
 
@@ -19,59 +20,55 @@ NEWS_HTML = """
 </body></html>
 """
 
+FINVIZ_URL = "https://finviz.com/groups.ashx?g=sector&v=110&o=-perf1w"
+# Encoded once so httpx_mock can serve the bytes as-is
+FINVIZ_BYTES = FINVIZ_HTML.encode()
+NEWS_BYTES = NEWS_HTML.encode()
+
 GOOGLE_NEWS_PATTERN = re.compile(r"https://www\.google\.com/search\?q=.*&tbm=nws.*")
 
 
-@pytest.mark.asyncio
-async def test_scrape_us_market_default(httpx_mock):
+@pytest_asyncio.fixture(scope="module")
+async def scraper():
+    """One SectorScraper (and httpx client) shared by every test in this module."""
+    sector_scraper = SectorScraper()
+    yield sector_scraper
+    await sector_scraper.close()
+
+
+@pytest.fixture
+def news_mock(httpx_mock):
+    """Serve the Google News search every sector scrape makes."""
+    httpx_mock.add_response(url=GOOGLE_NEWS_PATTERN, content=NEWS_BYTES)
+    return httpx_mock
+
+
+@pytest.fixture
+def finviz_mock(httpx_mock):
+    """Serve the FinViz sector table (US market only)."""
+    httpx_mock.add_response(url=FINVIZ_URL, content=FINVIZ_BYTES)
+    return httpx_mock
+
+
+async def test_scrape_us_market_default(finviz_mock, news_mock, scraper):
     """US market (default) should fetch FinViz and return US ETF."""
-    httpx_mock.add_response(
-        url="https://finviz.com/groups.ashx?g=sector&v=110&o=-perf1w",
-        text=FINVIZ_HTML,
-    )
-    httpx_mock.add_response(
-        url=GOOGLE_NEWS_PATTERN,
-        text=NEWS_HTML,
-    )
-
-    scraper = SectorScraper()
     result = await scraper.scrape("AAPL", sector="Technology")
 
     assert result["sector_etf"] == "XLK"
     assert result["ticker_sector"] == "Technology"
     assert len(result["sector_performance"]) == 1
     assert result["sector_performance"][0]["name"] == "Technology"
-    await scraper.close()
 
 
-@pytest.mark.asyncio
-async def test_scrape_us_market_explicit(httpx_mock):
+async def test_scrape_us_market_explicit(finviz_mock, news_mock, scraper):
     """Explicit market='US' should behave like default."""
-    httpx_mock.add_response(
-        url="https://finviz.com/groups.ashx?g=sector&v=110&o=-perf1w",
-        text=FINVIZ_HTML,
-    )
-    httpx_mock.add_response(
-        url=GOOGLE_NEWS_PATTERN,
-        text=NEWS_HTML,
-    )
-
-    scraper = SectorScraper()
     result = await scraper.scrape("AAPL", sector="Technology", market="US")
 
     assert result["sector_etf"] == "XLK"
-    await scraper.close()
 
 
-@pytest.mark.asyncio
-async def test_scrape_uk_market_skips_finviz(httpx_mock):
+async def test_scrape_uk_market_skips_finviz(news_mock, httpx_mock, scraper):
     """UK market should skip FinViz fetch and use UK ETFs."""
-    httpx_mock.add_response(
-        url=GOOGLE_NEWS_PATTERN,
-        text=NEWS_HTML,
-    )
-
-    scraper = SectorScraper()
     result = await scraper.scrape("VOD.L", sector="Communication Services", market="UK")
 
     assert result["sector_etf"] == "IUCM.L"
@@ -82,44 +79,22 @@ async def test_scrape_uk_market_skips_finviz(httpx_mock):
     # Verify no FinViz request was made
     urls = [str(req.url) for req in httpx_mock.get_requests()]
     assert not any("finviz.com" in url for url in urls)
-    await scraper.close()
 
 
-@pytest.mark.asyncio
-async def test_scrape_uk_fallback_etf(httpx_mock):
+async def test_scrape_uk_fallback_etf(news_mock, scraper):
     """UK market with unknown sector should fall back to ISF.L."""
-    httpx_mock.add_response(
-        url=GOOGLE_NEWS_PATTERN,
-        text=NEWS_HTML,
-    )
-
-    scraper = SectorScraper()
     result = await scraper.scrape("VOD.L", sector="SomeUnknownSector", market="UK")
 
     assert result["sector_etf"] == "ISF.L"
-    await scraper.close()
 
 
-@pytest.mark.asyncio
-async def test_scrape_us_fallback_etf(httpx_mock):
+async def test_scrape_us_fallback_etf(finviz_mock, news_mock, scraper):
     """US market with no sector should fall back to SPY."""
-    httpx_mock.add_response(
-        url="https://finviz.com/groups.ashx?g=sector&v=110&o=-perf1w",
-        text=FINVIZ_HTML,
-    )
-    httpx_mock.add_response(
-        url=GOOGLE_NEWS_PATTERN,
-        text=NEWS_HTML,
-    )
-
-    scraper = SectorScraper()
     result = await scraper.scrape("AAPL", sector=None, market="US")
 
     assert result["sector_etf"] == "SPY"
-    await scraper.close()
 
 
-@pytest.mark.asyncio
 async def test_uk_sector_etfs_coverage():
     """All US sectors should have a UK ETF counterpart."""
     for sector in SECTOR_ETFS:
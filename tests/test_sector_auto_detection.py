@@ -1,21 +1,15 @@
 """Tests for sector auto-detection functionality."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
-from src.api.routes import app
+from unittest.mock import ANY, AsyncMock, patch
 from src.scrapers.yfinance_provider import YFinanceProvider
 
 
-@pytest.fixture
-def client():
-    """Create a test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def mock_db():
-    """Mock the database."""
+@pytest.fixture(scope="module")
+def _db_mock_singleton():
+    """Patch the database once per module; ``mock_db`` resets it per test."""
     with patch("src.api.routes.db") as mock:
         mock.add_ticker = AsyncMock()
         mock.init = AsyncMock()
@@ -23,18 +17,33 @@ def mock_db():
         yield mock
 
 
+@pytest.fixture(scope="module")
+def _yf_mock_singleton():
+    """Patch the yfinance provider once per module; ``mock_yfinance`` resets it per test."""
+    with patch("src.api.routes.yfinance_provider", spec=YFinanceProvider) as mock:
+        yield mock
+
+
 @pytest.fixture
-def mock_yfinance():
+def mock_db(_db_mock_singleton):
+    """Mock the database."""
+    _db_mock_singleton.reset_mock(return_value=True, side_effect=True)
+    return _db_mock_singleton
+
+
+@pytest.fixture
+def mock_yfinance(_yf_mock_singleton):
     """Mock the yfinance provider."""
-    with patch("src.api.routes.yfinance_provider") as mock:
-        mock.resolve_symbol = MagicMock(return_value=("AAPL", "US"))
-        mock.get_sector_info = AsyncMock(return_value={
-            "sector": "Technology",
-            "sector_key": "technology",
-            "industry": "Consumer Electronics",
-            "industry_key": "consumer-electronics",
-        })
-        yield mock
+    mock = _yf_mock_singleton
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.resolve_symbol.return_value = ("AAPL", "US")
+    mock.get_sector_info.return_value = {
+        "sector": "Technology",
+        "sector_key": "technology",
+        "industry": "Consumer Electronics",
+        "industry_key": "consumer-electronics",
+    }
+    return mock
 
 
 class TestSectorDetectionIntegration:
@@ -61,13 +70,10 @@ class TestSectorDetectionIntegration:
         # Assert
         assert response.status_code == 303
         assert response.headers["location"] == "/"
-        mock_db.add_ticker.assert_called_once()
-        call_args = mock_db.add_ticker.call_args
-        assert call_args.args[0] == "AAPL"  # symbol
-        assert call_args.args[1] == "Apple Inc."  # name
-        assert call_args.args[2] == "Technology"  # auto-detected sector
-        assert call_args.kwargs["market"] == "US"
-        assert call_args.kwargs["resolved_symbol"] == "AAPL"
+        mock_db.add_ticker.assert_called_once_with(
+            "AAPL", "Apple Inc.", "Technology",  # auto-detected sector
+            market="US", resolved_symbol="AAPL",
+        )
 
     def test_add_ticker_endpoint_respects_user_sector(self, client, mock_db, mock_yfinance):
         """Test the /tickers endpoint uses user-provided sector when available."""
@@ -85,9 +91,10 @@ class TestSectorDetectionIntegration:
         # Assert
         assert response.status_code == 303
         mock_yfinance.get_sector_info.assert_not_called()  # Should not auto-detect
-        mock_db.add_ticker.assert_called_once()
-        call_args = mock_db.add_ticker.call_args
-        assert call_args.args[2] == "Healthcare"  # user-provided sector
+        mock_db.add_ticker.assert_called_once_with(
+            "AAPL", ANY, "Healthcare",  # user-provided sector
+            market=ANY, resolved_symbol=ANY,
+        )
 
     def test_add_ticker_endpoint_uk_market(self, client, mock_db, mock_yfinance):
         """Test the /tickers endpoint with UK market auto-detection."""
@@ -109,11 +116,10 @@ class TestSectorDetectionIntegration:
 
         # Assert
         assert response.status_code == 303
-        mock_db.add_ticker.assert_called_once()
-        call_args = mock_db.add_ticker.call_args
-        assert call_args.args[2] == "Financial Services"  # auto-detected sector
-        assert call_args.kwargs["market"] == "UK"
-        assert call_args.kwargs["resolved_symbol"] == "HSBA.L"
+        mock_db.add_ticker.assert_called_once_with(
+            "HSBC", ANY, "Financial Services",  # auto-detected sector
+            market="UK", resolved_symbol="HSBA.L",
+        )
 
     def test_add_ticker_endpoint_fallback_when_detection_fails(self, client, mock_db, mock_yfinance):
         """Test that None sector is stored when auto-detection fails."""
@@ -135,65 +141,60 @@ class TestSectorDetectionIntegration:
 
         # Assert
         assert response.status_code == 303
-        mock_db.add_ticker.assert_called_once()
-        call_args = mock_db.add_ticker.call_args
-        assert call_args.args[2] is None  # sector should be None
-
-    def test_add_ticker_endpoint_various_sectors(self, client, mock_db, mock_yfinance):
+        mock_db.add_ticker.assert_called_once_with(
+            "UNKNOWN", ANY, None,  # sector should be None
+            market=ANY, resolved_symbol=ANY,
+        )
+
+    @pytest.mark.parametrize("symbol,name,expected_sector", [
+        ("MSFT", "Microsoft", "Technology"),
+        ("JPM", "JPMorgan", "Financial Services"),
+        ("XOM", "Exxon Mobil", "Energy"),
+        ("JNJ", "Johnson & Johnson", "Healthcare"),
+        ("BA", "Boeing", "Industrials"),
+        ("TSLA", "Tesla", "Consumer Cyclical"),
+        ("KO", "Coca-Cola", "Consumer Defensive"),
+    ])
+    def test_add_ticker_endpoint_various_sectors(
+        self, client, mock_db, mock_yfinance, symbol, name, expected_sector,
+    ):
         """Test detection of various sectors via endpoint."""
-        test_cases = [
-            ("MSFT", "Microsoft", "Technology"),
-            ("JPM", "JPMorgan", "Financial Services"),
-            ("XOM", "Exxon Mobil", "Energy"),
-            ("JNJ", "Johnson & Johnson", "Healthcare"),
-            ("BA", "Boeing", "Industrials"),
-            ("TSLA", "Tesla", "Consumer Cyclical"),
-            ("KO", "Coca-Cola", "Consumer Defensive"),
-        ]
-
-        for symbol, name, expected_sector in test_cases:
-            # Reset mocks
-            mock_db.reset_mock()
-            mock_yfinance.reset_mock()
-            
-            # Arrange
-            mock_yfinance.resolve_symbol.return_value = (symbol, "US")
-            mock_yfinance.get_sector_info.return_value = {
-                "sector": expected_sector,
-                "sector_key": expected_sector.lower().replace(" ", "-"),
-                "industry": "Test Industry",
-                "industry_key": "test-industry",
-            }
+        # Arrange
+        mock_yfinance.resolve_symbol.return_value = (symbol, "US")
+        mock_yfinance.get_sector_info.return_value = {
+            "sector": expected_sector,
+            "sector_key": expected_sector.lower().replace(" ", "-"),
+            "industry": "Test Industry",
+            "industry_key": "test-industry",
+        }
 
-            # Act
-            response = client.post("/tickers", data={
-                "symbol": symbol,
-                "name": name,
-                "market": "US",
-            }, follow_redirects=False)
+        # Act
+        response = client.post("/tickers", data={
+            "symbol": symbol,
+            "name": name,
+            "market": "US",
+        }, follow_redirects=False)
 
-            # Assert
-            assert response.status_code == 303, f"Failed for {symbol}"
-            mock_db.add_ticker.assert_called_once()
-            call_args = mock_db.add_ticker.call_args
-            assert call_args.kwargs["resolved_symbol"] == symbol
+        # Assert
+        assert response.status_code == 303
+        mock_db.add_ticker.assert_called_once_with(
+            symbol, name, expected_sector, market="US", resolved_symbol=symbol,
+        )
 
 
 class TestYFinanceProviderSectorInfo:
     """Test YFinanceProvider.get_sector_info method."""
 
-    @pytest.mark.asyncio
     async def test_get_sector_info_success(self):
         """Test successful sector info retrieval."""
         # Arrange
         provider = YFinanceProvider()
-        mock_ticker = MagicMock()
-        mock_ticker.info = {
+        mock_ticker = SimpleNamespace(info={
             "sector": "Technology",
             "sectorKey": "technology",
             "industry": "Software - Infrastructure",
             "industryKey": "software-infrastructure",
-        }
+        })
         
         with patch.object(provider, "_get_ticker", return_value=mock_ticker):
             # Act
@@ -205,13 +206,11 @@ class TestYFinanceProviderSectorInfo:
         assert result["industry"] == "Software - Infrastructure"
         assert result["industry_key"] == "software-infrastructure"
 
-    @pytest.mark.asyncio
     async def test_get_sector_info_missing_data(self):
         """Test sector info when data is missing."""
         # Arrange
         provider = YFinanceProvider()
-        mock_ticker = MagicMock()
-        mock_ticker.info = {}  # Empty info
+        mock_ticker = SimpleNamespace(info={})  # Empty info
         
         with patch.object(provider, "_get_ticker", return_value=mock_ticker):
             # Act
@@ -223,7 +222,6 @@ class TestYFinanceProviderSectorInfo:
         assert result["industry"] is None
         assert result["industry_key"] is None
 
-    @pytest.mark.asyncio
     async def test_get_sector_info_exception_handling(self):
         """Test that exceptions are handled gracefully."""
         # Arrange
@@ -239,18 +237,16 @@ class TestYFinanceProviderSectorInfo:
         assert result["industry"] is None
         assert result["industry_key"] is None
 
-    @pytest.mark.asyncio
     async def test_get_sector_info_uk_ticker(self):
         """Test sector info for UK ticker."""
         # Arrange
         provider = YFinanceProvider()
-        mock_ticker = MagicMock()
-        mock_ticker.info = {
+        mock_ticker = SimpleNamespace(info={
             "sector": "Financial Services",
             "sectorKey": "financial-services",
             "industry": "Banks - Diversified",
             "industryKey": "banks-diversified",
-        }
+        })
         
         with patch.object(provider, "_get_ticker", return_value=mock_ticker):
             # Act
@@ -260,35 +256,31 @@ class TestYFinanceProviderSectorInfo:
         assert result["sector"] == "Financial Services"
         assert result["sector_key"] == "financial-services"
 
-    @pytest.mark.asyncio
-    async def test_get_sector_info_various_stocks(self):
+    @pytest.mark.parametrize("symbol,expected_sector,expected_industry", [
+        ("AAPL", "Technology", "Consumer Electronics"),
+        ("MSFT", "Technology", "Software"),
+        ("JPM", "Financial Services", "Banks"),
+        ("XOM", "Energy", "Oil & Gas"),
+        ("JNJ", "Healthcare", "Pharmaceuticals"),
+        ("BA", "Industrials", "Aerospace & Defense"),
+        ("TSLA", "Consumer Cyclical", "Auto Manufacturers"),
+        ("KO", "Consumer Defensive", "Beverages"),
+    ])
+    async def test_get_sector_info_various_stocks(self, symbol, expected_sector, expected_industry):
         """Test sector detection for various stock symbols."""
-        test_cases = [
-            ("AAPL", "Technology", "Consumer Electronics"),
-            ("MSFT", "Technology", "Software"),
-            ("JPM", "Financial Services", "Banks"),
-            ("XOM", "Energy", "Oil & Gas"),
-            ("JNJ", "Healthcare", "Pharmaceuticals"),
-            ("BA", "Industrials", "Aerospace & Defense"),
-            ("TSLA", "Consumer Cyclical", "Auto Manufacturers"),
-            ("KO", "Consumer Defensive", "Beverages"),
-        ]
-
-        for symbol, expected_sector, expected_industry in test_cases:
-            # Arrange
-            provider = YFinanceProvider()
-            mock_ticker = MagicMock()
-            mock_ticker.info = {
-                "sector": expected_sector,
-                "sectorKey": expected_sector.lower().replace(" ", "-"),
-                "industry": expected_industry,
-                "industryKey": expected_industry.lower().replace(" ", "-").replace("&", "and"),
-            }
-            
-            with patch.object(provider, "_get_ticker", return_value=mock_ticker):
-                # Act
-                result = await provider.get_sector_info(symbol)
-
-            # Assert
-            assert result["sector"] == expected_sector, f"Wrong sector for {symbol}"
-            assert result["industry"] == expected_industry, f"Wrong industry for {symbol}"
+        # Arrange
+        provider = YFinanceProvider()
+        mock_ticker = SimpleNamespace(info={
+            "sector": expected_sector,
+            "sectorKey": expected_sector.lower().replace(" ", "-"),
+            "industry": expected_industry,
+            "industryKey": expected_industry.lower().replace(" ", "-").replace("&", "and"),
+        })
+
+        with patch.object(provider, "_get_ticker", return_value=mock_ticker):
+            # Act
+            result = await provider.get_sector_info(symbol)
+
+        # Assert
+        assert result["sector"] == expected_sector
+        assert result["industry"] == expected_industry
@@ -2,10 +2,13 @@
 
 import pytest
 import pytest_asyncio
+import asyncio
 import json
-from fastapi.testclient import TestClient
-from src.api.routes import app
-from src.db import Database
+import logging
+import math
+import struct
+from unittest.mock import patch
+from src.db import Database, _json_loads
 from src.analysis.scoring import (
     weighted_score,
     score_to_recommendation,
@@ -16,15 +19,23 @@ from src.analysis.scoring import (
 )
 
 
-@pytest_asyncio.fixture
-async def db(tmp_path):
-    """Create a test database with initialized schema."""
-    database = Database(str(tmp_path / "test.db"))
+@pytest_asyncio.fixture(scope="module")
+async def _module_db(tmp_path_factory):
+    """Create one test database per module; migrations run only once."""
+    database = Database(str(tmp_path_factory.mktemp("settings") / "test.db"))
     await database.init()
     yield database
     await database.close()
 
 
+@pytest_asyncio.fixture
+async def db(_module_db):
+    """Provide the shared test database with an empty settings table."""
+    await _module_db.db.execute("DELETE FROM settings")
+    await _module_db.db.commit()
+    return _module_db
+
+
 class TestWeightValidation:
     """Test weight validation functions."""
 
@@ -49,6 +60,13 @@ class TestWeightValidation:
         assert is_valid is False
         assert "Unknown categories" in error
 
+    def test_validate_weights_category_errors_reported_before_sum(self):
+        """Test a missing category is reported even though the sum is also off."""
+        weights = {k: v for k, v in DEFAULT_CATEGORY_WEIGHTS.items() if k != "technicals"}
+        is_valid, error = validate_weights(weights)
+        assert is_valid is False
+        assert error == "Missing categories: technicals"
+
     def test_validate_weights_negative(self):
         """Test validation fails with negative weight."""
         weights = DEFAULT_CATEGORY_WEIGHTS.copy()
@@ -71,6 +89,11 @@ class TestWeightValidation:
         is_valid, error = validate_weights(weights)
         assert is_valid is True  # Should pass with tolerance
 
+        weights["fundamentals"] += 0.015  # Make sum 102%
+        is_valid, error = validate_weights(weights)
+        assert is_valid is False  # Outside tolerance
+        assert "must sum to 100%" in error
+
 
 class TestWeightNormalization:
     """Test weight normalization."""
@@ -80,7 +103,7 @@ class TestWeightNormalization:
         weights = {k: 1.0 for k in DEFAULT_CATEGORY_WEIGHTS.keys()}  # Equal weights
         normalized = normalize_weights(weights)
         total = sum(normalized.values())
-        assert abs(total - 1.0) < 0.001  # Allow small floating point误差
+        assert math.isclose(total, 1.0, abs_tol=1e-3)  # Values are rounded to 4 places
 
     def test_normalize_weights_zero_total(self):
         """Test normalization falls back to defaults when total is zero."""
@@ -162,8 +185,8 @@ class TestScoringPresets:
     def test_all_presets_sum_to_100(self):
         """Test all preset weights sum to 100%."""
         for preset_name, preset_data in SCORING_PRESETS.items():
-            total = sum(preset_data["weights"].values())
-            assert abs(total - 1.0) < 0.01, f"Preset {preset_name} weights sum to {total}"
+            total = math.fsum(preset_data["weights"].values())
+            assert math.isclose(total, 1.0, abs_tol=1e-9), f"Preset {preset_name} weights sum to {total}"
 
     def test_preset_structure(self):
         """Test all presets have required fields."""
@@ -177,13 +200,11 @@ class TestScoringPresets:
 class TestDatabaseSettings:
     """Test database settings methods."""
 
-    @pytest.mark.asyncio
     async def test_get_scoring_weights_default(self, db):
         """Test getting default weights when no settings exist."""
         weights = await db.get_scoring_weights()
         assert weights == DEFAULT_CATEGORY_WEIGHTS
 
-    @pytest.mark.asyncio
     async def test_set_and_get_scoring_weights(self, db):
         """Test saving and retrieving custom weights."""
         custom_weights = {
@@ -200,38 +221,105 @@ class TestDatabaseSettings:
         retrieved_weights = await db.get_scoring_weights()
         assert retrieved_weights == custom_weights
 
-    @pytest.mark.asyncio
+    async def test_scoring_weights_stored_as_json(self, db):
+        """Test weights are stored as self-describing JSON keyed by category."""
+        growth = SCORING_PRESETS["growth"]["weights"]
+        await db.set_scoring_weights(growth)
+        raw = await db.get_setting("scoring_weights")
+        assert json.loads(raw) == growth
+
+    async def test_get_scoring_weights_merges_partial_json(self, db):
+        """Test stored weights missing a category are filled from the defaults."""
+        await db.set_setting("scoring_weights", json.dumps({"fundamentals": 0.5}))
+        weights = await db.get_scoring_weights()
+        assert weights == {**DEFAULT_CATEGORY_WEIGHTS, "fundamentals": 0.5}
+
+    async def test_get_scoring_weights_unreadable_logs_warning(self, db, caplog):
+        """Test an unreadable stored value falls back to defaults with a warning."""
+        await db.set_setting("scoring_weights", "not json")
+        with caplog.at_level(logging.WARNING, logger="src.db"):
+            weights = await db.get_scoring_weights()
+        assert weights == DEFAULT_CATEGORY_WEIGHTS
+        assert "scoring weights" in caplog.text
+
+    async def test_settings_orjson_roundtrip(self, db):
+        """Test stored JSON weights parse bit-exactly with orjson and the stdlib."""
+        orjson = pytest.importorskip("orjson")
+        assert _json_loads is orjson.loads
+        stored = {
+            "fundamentals": 0.1 + 0.2,
+            "analyst_consensus": -0.15,
+            "insider_activity": 5e-324,
+            "technicals": 1e-17,
+            "sentiment": -2.220446049250313e-16,
+            "sector_context": 0.3333333333333333,
+            "risk_assessment": 0.7,
+        }
+        await db.set_setting("scoring_weights", json.dumps(stored))
+        for loads in (json.loads, _json_loads):
+            with patch("src.db._json_loads", loads):
+                weights = await db.get_scoring_weights()
+            assert all(
+                struct.pack("<d", weights[k]) == struct.pack("<d", v) for k, v in stored.items()
+            )
+
     async def test_get_active_preset_default(self, db):
         """Test getting active preset when none set."""
         preset = await db.get_active_preset()
         assert preset is None
 
-    @pytest.mark.asyncio
     async def test_set_and_get_active_preset(self, db):
         """Test saving and retrieving active preset."""
         await db.set_active_preset("growth")
         preset = await db.get_active_preset()
         assert preset == "growth"
 
-    @pytest.mark.asyncio
     async def test_settings_persistence(self, db):
         """Test that settings persist across multiple operations."""
-        # Set weights
-        await db.set_scoring_weights(SCORING_PRESETS["growth"]["weights"])
-        await db.set_active_preset("growth")
+        # Set weights and preset together
+        await db.set_settings(SCORING_PRESETS["growth"]["weights"], "growth")
         
-        # Retrieve and verify
-        weights = await db.get_scoring_weights()
-        preset = await db.get_active_preset()
+        # Retrieve both independently, as the settings page does on load
+        weights, preset = await asyncio.gather(db.get_scoring_weights(), db.get_active_preset())
         
         assert weights == SCORING_PRESETS["growth"]["weights"]
         assert preset == "growth"
 
+    async def test_concurrent_reads_share_connection(self, db):
+        """Test concurrent settings reads go through the one open connection."""
+        await db.set_settings(SCORING_PRESETS["value"]["weights"], "value")
+        with patch("aiosqlite.connect") as mock_connect, \
+             patch.object(db.db, "execute", wraps=db.db.execute) as mock_execute:
+            weights, preset = await asyncio.gather(
+                db.get_scoring_weights(), db.get_active_preset(),
+            )
+
+        mock_connect.assert_not_called()
+        assert mock_execute.call_count == 2
+        assert weights == SCORING_PRESETS["value"]["weights"]
+        assert preset == "value"
+
+    async def test_set_settings_single_transaction(self, db):
+        """Test weights and preset are written with a single commit."""
+        with patch.object(db.db, "commit", wraps=db.db.commit) as mock_commit:
+            await db.set_settings(SCORING_PRESETS["value"]["weights"], "value")
+
+        mock_commit.assert_awaited_once()
+        assert await db.get_scoring_weights() == SCORING_PRESETS["value"]["weights"]
+        assert await db.get_active_preset() == "value"
+
+    async def test_set_settings_without_preset_keeps_active_preset(self, db):
+        """Test omitting the preset leaves the stored preset untouched."""
+        await db.set_active_preset("growth")
+        await db.set_settings(SCORING_PRESETS["value"]["weights"])
+
+        assert await db.get_scoring_weights() == SCORING_PRESETS["value"]["weights"]
+        assert await db.get_active_preset() == "growth"
+
 
 class TestSettingsIntegration:
     """Integration tests for settings feature."""
 
-    @pytest.mark.asyncio
     async def test_weighted_score_uses_db_weights(self, db):
         """Test that weighted_score can use weights from database."""
         # Set custom weights
@@ -1,4 +1,4 @@
-import pytest
+import asyncio
 from unittest.mock import patch
 from src.scrapers.yfinance_provider import YFinanceProvider
 from src.scrapers.investegate import InvestegateScraper
@@ -7,7 +7,6 @@ from src.scrapers.investegate import InvestegateScraper
 class TestUKMarketFix:
     """Test UK market symbol resolution via yfinance Search API."""
 
-    @pytest.mark.asyncio
     async def test_hsbc_resolves_to_uk_with_preference(self):
         """Test HSBC resolves to HSBA.L when UK is preferred."""
         provider = YFinanceProvider()
@@ -20,7 +19,6 @@ class TestUKMarketFix:
             assert market == "UK"
             mock_search.assert_called_once_with("HSBC", "LSE")
 
-    @pytest.mark.asyncio
     async def test_bp_resolves_correctly_via_search(self):
         """Test BP resolves to BP.L via search when UK is preferred."""
         provider = YFinanceProvider()
@@ -32,7 +30,6 @@ class TestUKMarketFix:
             assert resolved == "BP.L"
             assert market == "UK"
 
-    @pytest.mark.asyncio
     async def test_us_symbol_unchanged_when_no_preference(self):
         """Test US symbols work normally without market preference."""
         provider = YFinanceProvider()
@@ -44,7 +41,6 @@ class TestUKMarketFix:
             assert resolved == "AAPL"
             assert market == "US"
 
-    @pytest.mark.asyncio
     async def test_investegate_finds_hsbc_announcements(self):
         """Test Investegate scraper finds HSBC announcements."""
         scraper = InvestegateScraper()
@@ -77,7 +73,39 @@ class TestUKMarketFix:
         assert trade["insider_name"] == "Test Director"
         assert trade["trade_type"] == "Buy"
 
-    @pytest.mark.asyncio
+    async def test_scrape_batches_concurrently(self):
+        """Test Investegate detail pages are parsed concurrently, in listing order."""
+        scraper = InvestegateScraper()
+
+        mock_html = '''
+        <html>
+            <body>
+                <a href="/announcement/rns/hsbc-holdings--hsba/director-dealing/1">HSBC: Director Dealing</a>
+                <a href="/announcement/rns/hsbc-holdings--hsba/director-dealing/2">HSBC: Director Dealing</a>
+                <a href="/announcement/rns/hsbc-holdings--hsba/director-dealing/3">HSBC: Director Dealing</a>
+            </body>
+        </html>
+        '''
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_parse_detail(item):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"insider_name": item["url"].rsplit("/", 1)[-1]}
+
+        with patch.object(scraper, 'fetch', return_value=mock_html) as mock_fetch, \
+             patch.object(scraper, '_parse_detail', side_effect=fake_parse_detail):
+            result = await scraper.scrape("HSBA.L")
+
+        mock_fetch.assert_called_once()  # listing page only
+        assert max_in_flight == 3
+        assert [t["insider_name"] for t in result["insider_trades"]] == ["1", "2", "3"]
+        await scraper.close()
+
     async def test_symbol_resolution_cache_works_with_preference(self):
         """Test symbol resolution caching works with preferred market."""
         provider = YFinanceProvider()
@@ -92,7 +120,62 @@ class TestUKMarketFix:
             assert resolved1 == resolved2 == "HSBA.L"
             assert market1 == market2 == "UK"
 
-    @pytest.mark.asyncio
+    async def test_resolve_symbols_batch(self):
+        """Test a batch of symbols is resolved in one call, one probe each."""
+        provider = YFinanceProvider()
+        symbols = [f"SYM{i}" for i in range(50)]
+
+        with patch.object(provider, '_probe_symbol') as mock_probe:
+            mock_probe.return_value = {"regularMarketPrice": 10}
+
+            resolved = await provider.resolve_symbols(symbols)
+
+        assert mock_probe.call_count == 50
+        assert resolved == {sym: (sym, "US") for sym in symbols}
+
+    async def test_resolve_symbols_skips_unresolvable(self):
+        """Test unresolvable symbols are left out of the batch result."""
+        provider = YFinanceProvider()
+
+        with patch.object(provider, '_search_symbol', return_value=None), \
+             patch.object(provider, '_probe_symbol') as mock_probe:
+            mock_probe.side_effect = lambda sym: {"regularMarketPrice": 10} if sym == "AAPL" else None
+
+            resolved = await provider.resolve_symbols(["AAPL", "NOPE", "AAPL"])
+
+        assert resolved == {"AAPL": ("AAPL", "US")}
+
+    async def test_resolve_symbol_cache_evicts_oldest(self):
+        """Test the resolution cache is LRU-bounded."""
+        provider = YFinanceProvider()
+
+        with patch.object(provider, '_probe_symbol') as mock_probe, \
+             patch("src.scrapers.yfinance_provider._RESOLVE_CACHE_MAX", 3):
+            mock_probe.return_value = {"regularMarketPrice": 10}
+
+            for sym in ("A", "B", "C"):
+                provider.resolve_symbol(sym)
+            provider.resolve_symbol("A")  # refresh A, so B is now the oldest
+            provider.resolve_symbol("D")
+            assert mock_probe.call_count == 4
+
+            provider.resolve_symbol("A")
+            provider.resolve_symbol("D")
+            assert mock_probe.call_count == 4  # still cached
+            provider.resolve_symbol("B")
+            assert mock_probe.call_count == 5  # evicted, probed again
+
+    async def test_resolution_cache_is_per_preferred_market(self):
+        """Test a US resolution is not reused when UK is preferred."""
+        provider = YFinanceProvider()
+
+        with patch.object(provider, '_probe_symbol', return_value={"regularMarketPrice": 90}), \
+             patch.object(provider, '_search_symbol') as mock_search:
+            mock_search.return_value = ("HSBA.L", {"regularMarketPrice": 1300})
+
+            assert provider.resolve_symbol("HSBC") == ("HSBC", "US")
+            assert provider.resolve_symbol("HSBC", preferred_market="UK") == ("HSBA.L", "UK")
+
     async def test_fallback_to_us_when_uk_not_available(self):
         """Test fallback to US when UK symbol doesn't exist."""
         provider = YFinanceProvider()
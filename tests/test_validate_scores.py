@@ -1,3 +1,4 @@
+import json
 import logging
 from src.analysis.engine import _validate_signal_result
 
@@ -23,6 +24,15 @@ def test_boundary_scores_unchanged():
     assert _validate_signal_result({"score": -10})["score"] == -10
 
 
+def test_float_boundary_scores_not_clamped(caplog):
+    for score in (10.0, -10.0):
+        original = {"score": score, "confidence": "high"}
+        with caplog.at_level(logging.WARNING):
+            result = _validate_signal_result(original)
+        assert result is original
+    assert "out of range" not in caplog.text
+
+
 def test_missing_score_defaults_to_zero():
     result = _validate_signal_result({"confidence": "high"})
     assert result["score"] == 0
@@ -64,3 +74,14 @@ def test_invalid_confidence_logs_warning(caplog):
     with caplog.at_level(logging.WARNING):
         _validate_signal_result({"score": 5, "confidence": "extreme"})
     assert "Invalid confidence" in caplog.text
+
+
+def test_valid_input_returned_without_copy():
+    original = {"score": 5, "confidence": "high", "narrative": "test"}
+    assert _validate_signal_result(original) is original
+
+
+def test_parsed_llm_output_returned_without_copy():
+    # json.loads builds fresh, non-interned strings
+    original = json.loads('{"score": 5, "confidence": "high"}')
+    assert _validate_signal_result(original) is original
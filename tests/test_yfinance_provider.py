@@ -1,10 +1,14 @@
 """Tests for YFinanceProvider with mocked yfinance.Ticker."""
 
+from types import SimpleNamespace
+
 import pytest
 import pandas as pd
 import numpy as np
 from unittest.mock import MagicMock, patch
-from src.scrapers.yfinance_provider import YFinanceProvider, _fmt, _map_info
+from src.scrapers.yfinance_provider import (
+    YFinanceProvider, _fmt, _last_valid, _map_info, _market_for_symbol,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -64,15 +68,31 @@ def _make_news():
     ]
 
 
+# Built once and shared by every test; the provider never mutates them
+_INFO = _make_info()
+_HIST = _make_history()
+_NEWS = _make_news()
+
+
+def _stub_ticker(history=_HIST):
+    """Plain stand-in for yf.Ticker exposing just what the provider reads."""
+    return SimpleNamespace(info=_INFO, history=lambda period="1y": history, news=_NEWS)
+
+
 @pytest.fixture
 def provider():
-    """YFinanceProvider with a mocked _get_ticker."""
+    """YFinanceProvider whose _get_ticker is a plain function returning a stub."""
     p = YFinanceProvider()
-    mock_ticker = MagicMock()
-    mock_ticker.info = _make_info()
-    mock_ticker.history.return_value = _make_history()
-    mock_ticker.news = _make_news()
-    p._get_ticker = MagicMock(return_value=mock_ticker)
+    ticker = _stub_ticker()
+    p._get_ticker = lambda symbol: ticker
+    return p
+
+
+@pytest.fixture
+def provider_counted():
+    """Like ``provider``, but _get_ticker is a MagicMock for call-count assertions."""
+    p = YFinanceProvider()
+    p._get_ticker = MagicMock(return_value=_stub_ticker())
     return p
 
 
@@ -92,6 +112,15 @@ def test_fmt_large_float():
     assert _fmt(28.5) == "28.50"
 
 
+def test_fmt_numpy_float():
+    assert _fmt(np.float64(0.44)) == "44.00%"
+    assert _fmt(np.float64(28.5)) == "28.50"
+
+
+def test_fmt_int():
+    assert _fmt(50_000_000) == "50000000"
+
+
 def test_fmt_string():
     assert _fmt("hello") == "hello"
 
@@ -105,6 +134,27 @@ def test_map_info_basic():
     assert "X" not in result
 
 
+def test_map_info_skips_none_values():
+    result = _map_info({"trailingPE": None, "forwardPE": 25.0}, {"trailingPE": "P/E", "forwardPE": "Forward P/E"})
+    assert result == {"Forward P/E": "25.00"}
+
+
+@pytest.mark.parametrize("symbol,market", [
+    ("VOD.L", "UK"),
+    ("VOD.LN", "UK"),
+    ("AAPL", "US"),
+    ("BRK.B", "US"),
+    ("LLOY", "US"),
+])
+def test_market_for_symbol(symbol, market):
+    assert _market_for_symbol(symbol) == market
+
+
+def test_last_valid_skips_trailing_nan():
+    assert _last_valid(pd.Series([1.0, 2.0, np.nan])) == 2.0
+    assert _last_valid(pd.Series([np.nan, np.nan])) is None
+
+
 # ---------------------------------------------------------------------------
 # get_fundamentals
 # ---------------------------------------------------------------------------
@@ -124,6 +174,28 @@ async def test_get_fundamentals_percentage_formatting(provider):
     assert result["Gross Margin"] == "44.00%"
 
 
+@pytest.mark.asyncio
+async def test_get_many_fundamentals_fetches_each_symbol_once(provider_counted):
+    result = await provider_counted.get_many_fundamentals(["AAPL", "MSFT", "AAPL"])
+    assert list(result) == ["AAPL", "MSFT"]
+    assert result["AAPL"]["P/E"] == "28.50"
+    assert provider_counted._get_ticker.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_many_fundamentals_skips_failures(provider):
+    good = _stub_ticker()
+
+    def _get_ticker(symbol):
+        if symbol == "BAD":
+            raise RuntimeError("boom")
+        return good
+
+    provider._get_ticker = _get_ticker
+    result = await provider.get_many_fundamentals(["AAPL", "BAD"])
+    assert list(result) == ["AAPL"]
+
+
 # ---------------------------------------------------------------------------
 # get_technicals
 # ---------------------------------------------------------------------------
@@ -146,6 +218,66 @@ async def test_get_technicals_rsi_in_valid_range(provider):
     assert 0 <= rsi_val <= 100
 
 
+@pytest.mark.asyncio
+async def test_get_technicals_indicators_match_series(provider):
+    """The reported RSI is the last value of the full indicator series."""
+    from src.analysis.indicators import rsi
+
+    result = await provider.get_technicals("AAPL")
+    close = _HIST["Close"]
+    assert result["RSI (14)"] == f"{rsi(close).dropna().iloc[-1]:.2f}"
+    assert "SMA200" in result
+
+
+@pytest.mark.asyncio
+async def test_get_technicals_sma_matches_rolling_mean(provider):
+    from src.analysis.indicators import sma
+
+    result = await provider.get_technicals("AAPL")
+    close = _HIST["Close"]
+    last_sma50 = sma(close, 50).iloc[-1]
+    assert result["SMA50"] == f"{(190.0 - last_sma50) / last_sma50 * 100:.2f}%"
+
+
+@pytest.mark.asyncio
+async def test_get_technicals_volatility_matches_bollinger_bands(provider):
+    from src.analysis.indicators import bollinger_bands
+
+    result = await provider.get_technicals("AAPL")
+    upper, middle, lower = bollinger_bands(_HIST["Close"])
+    bw = (upper.iloc[-1] - lower.iloc[-1]) / middle.iloc[-1] * 100
+    assert result["Volatility"] == f"{bw:.2f}%"
+
+
+@pytest.mark.asyncio
+async def test_get_technicals_short_history_skips_indicators(provider):
+    """Histories shorter than an indicator's window never compute it."""
+    short = _stub_ticker(_make_history(10))
+    provider._get_ticker = lambda symbol: short
+    with patch("src.scrapers.yfinance_provider.rsi") as mock_rsi, \
+         patch("src.scrapers.yfinance_provider.bollinger_bands") as mock_bb:
+        result = await provider.get_technicals("AAPL")
+
+    mock_rsi.assert_not_called()
+    mock_bb.assert_not_called()
+    assert "Price" in result
+    assert "Perf Week" in result
+    assert "RSI (14)" not in result
+
+
+@pytest.mark.asyncio
+async def test_get_technicals_zero_price_history(provider):
+    """A zero SMA is reported as a value instead of dividing by zero."""
+    zeros = _make_history(60).assign(High=0.0, Low=0.0, Close=0.0)
+    ticker = SimpleNamespace(info=_make_info(currentPrice=1.0), history=lambda period="1y": zeros, news=[])
+    provider._get_ticker = lambda symbol: ticker
+    result = await provider.get_technicals("AAPL")
+
+    assert result["SMA20"] == "0.00"
+    assert result["SMA50"] == "0.00"
+    assert "SMA200" not in result
+
+
 @pytest.mark.asyncio
 async def test_get_technicals_empty_history():
     """Provider should handle empty history gracefully."""
@@ -207,20 +339,65 @@ async def test_get_news_empty():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_caches_per_symbol(provider):
-    await provider.get_fundamentals("AAPL")
-    await provider.get_technicals("AAPL")
-    await provider.get_analyst_data("AAPL")
+async def test_caches_per_symbol(provider_counted):
+    await provider_counted.get_fundamentals("AAPL")
+    await provider_counted.get_technicals("AAPL")
+    await provider_counted.get_analyst_data("AAPL")
     # _get_ticker should only be called once
-    assert provider._get_ticker.call_count == 1
+    assert provider_counted._get_ticker.call_count == 1
 
 
 @pytest.mark.asyncio
-async def test_clear_cache(provider):
-    await provider.get_fundamentals("AAPL")
+async def test_technicals_computed_once_per_cache_entry(provider):
+    first = await provider.get_technicals("AAPL")
+    first["RSI (14)"] = "mutated"
+    with patch("src.scrapers.yfinance_provider.rsi") as mock_rsi:
+        second = await provider.get_technicals("AAPL")
+    mock_rsi.assert_not_called()
+    assert second["RSI (14)"] != "mutated"
+
     provider.clear_cache("AAPL")
-    await provider.get_fundamentals("AAPL")
-    assert provider._get_ticker.call_count == 2
+    assert await provider.get_technicals("AAPL") == second
+
+
+@pytest.mark.asyncio
+async def test_cached_history_keeps_price_columns_only(provider):
+    await provider.get_technicals("AAPL")
+    assert list(provider._cache["AAPL"]["hist"].columns) == ["High", "Low", "Close"]
+
+
+@pytest.mark.asyncio
+async def test_ticker_cache_evicts_least_recently_used(provider_counted):
+    with patch("src.scrapers.yfinance_provider._TICKER_CACHE_MAX", 2):
+        await provider_counted.get_fundamentals("A")
+        await provider_counted.get_fundamentals("B")
+        await provider_counted.get_fundamentals("A")  # refresh A, so B is now the oldest
+        await provider_counted.get_fundamentals("C")
+        assert list(provider_counted._cache) == ["A", "C"]
+
+        await provider_counted.get_fundamentals("B")
+        assert provider_counted._get_ticker.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_ticker_cache_expires_after_ttl(provider_counted):
+    with patch("src.scrapers.yfinance_provider._now", return_value=1000.0):
+        await provider_counted.get_technicals("AAPL")
+    with patch("src.scrapers.yfinance_provider._now", return_value=1299.0):
+        await provider_counted.get_technicals("AAPL")
+    assert provider_counted._get_ticker.call_count == 1
+
+    with patch("src.scrapers.yfinance_provider._now", return_value=1300.0):
+        await provider_counted.get_technicals("AAPL")
+    assert provider_counted._get_ticker.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_cache(provider_counted):
+    await provider_counted.get_fundamentals("AAPL")
+    provider_counted.clear_cache("AAPL")
+    await provider_counted.get_fundamentals("AAPL")
+    assert provider_counted._get_ticker.call_count == 2
 
 
 # ---------------------------------------------------------------------------
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import patch
 from src.scrapers.yfinance_provider import YFinanceProvider
@@ -83,3 +85,39 @@ class TestYFinanceSymbolResolution:
             assert mock_probe.call_count == 1
             assert resolved1 == resolved2
             assert market1 == market2
+
+    @pytest.mark.asyncio
+    async def test_probe_symbol_hot_path_one_slot_cache(self, provider):
+        """Test probing the same symbol twice in a row hits yfinance once."""
+        ticker = SimpleNamespace(info={"regularMarketPrice": 1300})
+        with patch.object(provider, '_get_ticker', return_value=ticker) as mock_get:
+            assert provider._probe_symbol("HSBA.L") == ticker.info
+            assert provider._probe_symbol("HSBA.L") == ticker.info
+            assert mock_get.call_count == 1
+
+            provider._probe_symbol("BP.L")
+            assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_probe_symbol_failure_not_cached(self, provider):
+        """Test a failed probe is retried rather than remembered."""
+        ticker = SimpleNamespace(info={})
+        with patch.object(provider, '_get_ticker', return_value=ticker) as mock_get:
+            assert provider._probe_symbol("NOPE") is None
+            assert provider._probe_symbol("NOPE") is None
+            assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_symbol_requests_quotes_only(self, provider):
+        """Test the search asks Yahoo for quotes only and probes LSE matches."""
+        results = SimpleNamespace(quotes=[
+            {"symbol": "HSBC", "exchange": "NYQ"},
+            {"symbol": "HSBA.L", "exchange": "LSE"},
+        ])
+        with patch("src.scrapers.yfinance_provider.yf.Search", return_value=results) as mock_search, \
+             patch.object(provider, '_probe_symbol', return_value={"regularMarketPrice": 650}):
+            assert provider._search_symbol("HSBC", "LSE") == ("HSBA.L", {"regularMarketPrice": 650})
+
+        mock_search.assert_called_once_with(
+            "HSBC", news_count=0, lists_count=0, include_cb=False, recommended=0,
+        )